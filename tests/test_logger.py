@@ -9,8 +9,7 @@ class TestLogger(unittest.TestCase):
     def setUp(self):
         """Reset logging configuration before each test."""
         # Remove all handlers from root logger
-        for handler in logging.root.handlers[:]:
-            logging.root.removeHandler(handler)
+        logging.root.handlers.clear()
         logging.root.setLevel(logging.WARNING)  # Reset to default
 
     def test_get_logger_returns_correct_logger(self):